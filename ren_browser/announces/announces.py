@@ -4,13 +4,21 @@ This module provides services for listening to and collecting network
 announces from the Reticulum network.
 """
 
+import queue
+import threading
 import time
+from collections import OrderedDict
 from dataclasses import dataclass
 
 import RNS
 
+# Seconds to wait before notifying the UI, so announce bursts trigger one redraw.
+UPDATE_DELAY = 0.1
+# Announces buffered between the RNS thread and the worker before dropping.
+QUEUE_SIZE = 4096
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class Announce:
     """Represents a Reticulum network announce.
 
@@ -25,20 +33,34 @@ class Announce:
 class AnnounceService:
     """Service to listen for Reticulum announces and collect them.
 
-    Calls update_callback whenever a new announce is received.
+    Announces are handed off from the RNS thread to a worker thread, and
+    update_callback is called shortly afterwards, batching bursts into a
+    single notification.
     """
 
-    def __init__(self, update_callback):
+    def __init__(self, update_callback, max_announces: int = 1024):
         """Initialize the announce service.
 
         Args:
-            update_callback: Function called when new announces are received.
+            update_callback: Function called with an immutable tuple snapshot
+                of the announces when new announces are received.
+            max_announces: Maximum number of announces retained; the oldest
+                are dropped once the limit is exceeded.
 
         """
         self.aspect_filter = "nomadnetwork.node"
         self.receive_path_responses = True
-        self.announces: list[Announce] = []
+        self._announces: OrderedDict[str, Announce] = OrderedDict()
+        self.max_announces = max_announces
         self.update_callback = update_callback
+        self._lock = threading.Lock()
+        self._update_timer: threading.Timer | None = None
+        self._queue: queue.Queue = queue.Queue(maxsize=QUEUE_SIZE)
+        threading.Thread(
+            target=self._process_queue,
+            name="AnnounceService",
+            daemon=True,
+        ).start()
         # RNS should already be initialized by main app
         RNS.Transport.register_announce_handler(self)
         RNS.log("AnnounceService: registered announce handler")
@@ -46,30 +68,68 @@ class AnnounceService:
     def received_announce(self, destination_hash, announced_identity, app_data):
         """Handle received announce from Reticulum network.
 
+        Only enqueues the announce so the RNS transport thread is not held up;
+        announces arriving while the queue is full are dropped.
+
         Args:
             destination_hash: Hash of the announcing destination.
             announced_identity: Identity of the announcer.
             app_data: Optional application data from the announce.
 
         """
-        RNS.log(f"AnnounceService: received announce from {destination_hash.hex()}")
-        ts = int(time.time())
+        try:
+            self._queue.put_nowait((destination_hash, app_data, int(time.time())))
+        except queue.Full:
+            pass
+
+    def _process_queue(self):
+        """Store queued announces until the process exits."""
+        while True:
+            destination_hash, app_data, ts = self._queue.get()
+            try:
+                self._store_announce(destination_hash, app_data, ts)
+            finally:
+                self._queue.task_done()
+
+    def _store_announce(self, destination_hash, app_data, ts):
+        """Record an announce and schedule a UI notification."""
+        hex_hash = destination_hash.hex()
+        if RNS.loglevel >= RNS.LOG_DEBUG:
+            RNS.log(
+                f"AnnounceService: received announce from {hex_hash}",
+                RNS.LOG_DEBUG,
+            )
         display_name = None
         if app_data:
             try:
                 display_name = app_data.decode("utf-8")
             except UnicodeDecodeError:
                 pass
-        announce = Announce(destination_hash.hex(), display_name, ts)
-        self.announces = [
-            ann
-            for ann in self.announces
-            if ann.destination_hash != announce.destination_hash
-        ]
-        self.announces.insert(0, announce)
+        with self._lock:
+            # Newest first: replace any previous entry and move it to the front.
+            self._announces[hex_hash] = Announce(hex_hash, display_name, ts)
+            self._announces.move_to_end(hex_hash, last=False)
+            while len(self._announces) > self.max_announces:
+                self._announces.popitem(last=True)
         if self.update_callback:
-            self.update_callback(self.announces)
-
-    def get_announces(self) -> list[Announce]:
-        """Return collected announces."""
-        return self.announces
+            self._schedule_update()
+
+    def _schedule_update(self):
+        """Arm the update timer unless a notification is already pending."""
+        with self._lock:
+            if self._update_timer is not None:
+                return
+            self._update_timer = threading.Timer(UPDATE_DELAY, self._flush_update)
+            self._update_timer.daemon = True
+            self._update_timer.start()
+
+    def _flush_update(self):
+        """Notify update_callback with the announces collected so far."""
+        with self._lock:
+            self._update_timer = None
+        self.update_callback(self.get_announces())
+
+    def get_announces(self) -> tuple[Announce, ...]:
+        """Return an immutable snapshot of collected announces, newest first."""
+        with self._lock:
+            return tuple(self._announces.values())
@@ -10,7 +10,6 @@ import os
 from pathlib import Path
 
 import flet as ft
-import RNS
 from flet import AppView, Page
 
 from ren_browser import rns
@@ -22,6 +21,35 @@ RNS_CONFIG_DIR = None
 RNS_INSTANCE = None
 logger = logging.getLogger(__name__)
 
+_PARSER = argparse.ArgumentParser(description="Ren Browser")
+_PARSER.add_argument(
+    "-r",
+    "--renderer",
+    choices=["plaintext", "micron"],
+    default=RENDERER,
+    help="Select renderer (plaintext or micron)",
+)
+_PARSER.add_argument(
+    "-w",
+    "--web",
+    action="store_true",
+    help="Launch in web browser mode",
+)
+_PARSER.add_argument(
+    "-p",
+    "--port",
+    type=int,
+    default=None,
+    help="Port for web server",
+)
+_PARSER.add_argument(
+    "-c",
+    "--config-dir",
+    type=str,
+    default=None,
+    help="RNS config directory (default: ~/.reticulum/)",
+)
+
 
 async def main(page: Page):
     """Initialize and launch the Ren Browser application.
@@ -104,19 +132,16 @@ async def reload_reticulum(page: Page, on_complete=None):
         global RNS_INSTANCE
 
         if RNS_INSTANCE:
-            try:
-                RNS_INSTANCE.exit_handler()
+            if rns.shutdown_reticulum():
                 print("RNS exit handler completed")
-            except Exception as e:
-                print(f"Warning during RNS shutdown: {e}")
-
-            rns.shutdown_reticulum()
-            RNS.Reticulum._Reticulum__instance = None
-            RNS.Transport.destinations = []
+            else:
+                print(f"Warning during RNS shutdown: {rns.get_last_error()}")
             RNS_INSTANCE = None
             print("RNS instance cleared")
 
-        await asyncio.sleep(0.5)
+            # Give detached interfaces a moment to release their sockets before
+            # the new instance binds them; nothing to wait for on a cold start.
+            await asyncio.sleep(0.5)
 
         success = rns.initialize_reticulum(RNS_CONFIG_DIR)
         if success:
@@ -138,35 +163,7 @@ async def reload_reticulum(page: Page, on_complete=None):
 def run():
     """Run Ren Browser with command line argument parsing."""
     global RENDERER, RNS_CONFIG_DIR
-    parser = argparse.ArgumentParser(description="Ren Browser")
-    parser.add_argument(
-        "-r",
-        "--renderer",
-        choices=["plaintext", "micron"],
-        default=RENDERER,
-        help="Select renderer (plaintext or micron)",
-    )
-    parser.add_argument(
-        "-w",
-        "--web",
-        action="store_true",
-        help="Launch in web browser mode",
-    )
-    parser.add_argument(
-        "-p",
-        "--port",
-        type=int,
-        default=None,
-        help="Port for web server",
-    )
-    parser.add_argument(
-        "-c",
-        "--config-dir",
-        type=str,
-        default=None,
-        help="RNS config directory (default: ~/.reticulum/)",
-    )
-    args = parser.parse_args()
+    args = _PARSER.parse_args()
     RENDERER = args.renderer
 
     # Set RNS config directory
@@ -208,16 +205,8 @@ def run_dev():
     ft.app(main)
 
 
-def web_dev():
-    """Launch Ren Browser in web mode."""
-    ft.app(main, view=AppView.WEB_BROWSER)
-
-
-def android_dev():
-    """Launch Ren Browser in Android mode."""
-    ft.app(main, view=AppView.FLET_APP_WEB)
-
-
-def ios_dev():
-    """Launch Ren Browser in iOS mode."""
-    ft.app(main, view=AppView.FLET_APP_WEB)
+# The *_dev entry points differ from their release counterparts only in the
+# script name, so they share the same launcher.
+web_dev = web
+android_dev = android
+ios_dev = ios
@@ -23,6 +23,15 @@ class Shortcuts:
         """
         self.page = page
         self.tab_manager = tab_manager
+        # Single-character keys are matched case-insensitively, named keys
+        # such as "Tab" exactly.
+        self._handlers = {
+            "t": self._new_tab,
+            "w": self._close_tab,
+            "l": self._focus_url,
+            "a": self._open_drawer,
+            "Tab": self._cycle_tabs,
+        }
         page.on_keyboard_event = self.on_keyboard
 
     def on_keyboard(self, e: ft.KeyboardEvent):
@@ -33,31 +42,37 @@ class Shortcuts:
 
         """
         # Support Ctrl (and Meta on macOS)
-        ctrl = e.ctrl or e.meta
-        if not ctrl:
+        if not (e.ctrl or e.meta):
             return
         key = e.key
-        # New tab: Ctrl+T
-        if key.lower() == "t":
-            self.tab_manager._on_add_click(None)
-        # Close tab: Ctrl+W
-        elif key.lower() == "w":
-            self.tab_manager._on_close_click(None)
-        # Focus URL bar: Ctrl+L
-        elif key.lower() == "l":
-            idx = self.tab_manager.manager.index
-            field = self.tab_manager.manager.tabs[idx]["url_field"]
-            field.focus()
-        # Show announces drawer: Ctrl+A
-        elif key.lower() == "a":
-            self.page.drawer.open = True
-        # Cycle through tabs: Ctrl+Tab / Ctrl+Shift+Tab
-        elif key == "Tab":
-            idx = self.tab_manager.manager.index
-            count = len(self.tab_manager.manager.tabs)
-            new_idx = (idx - 1) % count if e.shift else (idx + 1) % count
-            self.tab_manager.select_tab(new_idx)
-        else:
+        handler = self._handlers.get(key.lower() if len(key) == 1 else key)
+        if handler is None:
             return
+        handler(e)
         # Apply UI updates
         self.page.update()
+
+    def _new_tab(self, e: ft.KeyboardEvent):
+        """New tab: Ctrl+T."""
+        self.tab_manager._on_add_click(None)
+
+    def _close_tab(self, e: ft.KeyboardEvent):
+        """Close tab: Ctrl+W."""
+        self.tab_manager._on_close_click(None)
+
+    def _focus_url(self, e: ft.KeyboardEvent):
+        """Focus URL bar: Ctrl+L."""
+        idx = self.tab_manager.manager.index
+        field = self.tab_manager.manager.tabs[idx]["url_field"]
+        field.focus()
+
+    def _open_drawer(self, e: ft.KeyboardEvent):
+        """Show announces drawer: Ctrl+A."""
+        self.page.drawer.open = True
+
+    def _cycle_tabs(self, e: ft.KeyboardEvent):
+        """Cycle through tabs: Ctrl+Tab / Ctrl+Shift+Tab."""
+        idx = self.tab_manager.manager.index
+        count = len(self.tab_manager.manager.tabs)
+        new_idx = (idx - 1) % count if e.shift else (idx + 1) % count
+        self.tab_manager.select_tab(new_idx)
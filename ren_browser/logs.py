@@ -4,14 +4,35 @@ Provides centralized logging for application events, errors, and
 Reticulum network activities.
 """
 
-import datetime
+import time
+from collections import deque
 
 import RNS
 
-APP_LOGS: list[str] = []
-ERROR_LOGS: list[str] = []
-RET_LOGS: list[str] = []
+# Each stream keeps only its most recent entries.
+MAX_LOG_ENTRIES = 10_000
+APP_LOGS: deque[str] = deque(maxlen=MAX_LOG_ENTRIES)
+ERROR_LOGS: deque[str] = deque(maxlen=MAX_LOG_ENTRIES)
+RET_LOGS: deque[str] = deque(maxlen=MAX_LOG_ENTRIES)
 _original_rns_log = RNS.log
+# (epoch second, "YYYY-MM-DDTHH:MM:SS") for the most recently formatted second.
+_timestamp_cache: tuple[int, str] = (-1, "")
+
+
+def _timestamp() -> str:
+    """Return the local time in ``datetime.isoformat()`` form.
+
+    The date and time of day are formatted once per second; only the
+    microseconds are formatted on every call.
+    """
+    global _timestamp_cache
+    second, nanos = divmod(time.time_ns(), 1_000_000_000)
+    cached_second, prefix = _timestamp_cache
+    if second != cached_second:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(second))
+        _timestamp_cache = (second, prefix)
+    micros = nanos // 1000
+    return f"{prefix}.{micros:06d}" if micros else prefix
 
 
 def log_ret(msg, *args, **kwargs):
@@ -23,7 +44,7 @@ def log_ret(msg, *args, **kwargs):
         **kwargs: Additional keyword arguments passed to original RNS.log.
 
     """
-    timestamp = datetime.datetime.now().isoformat()
+    timestamp = _timestamp()
     RET_LOGS.append(f"[{timestamp}] {msg}")
     return _original_rns_log(msg, *args, **kwargs)
 
@@ -44,7 +65,7 @@ def log_error(msg: str):
         msg: Error message to log.
 
     """
-    timestamp = datetime.datetime.now().isoformat()
+    timestamp = _timestamp()
     ERROR_LOGS.append(f"[{timestamp}] {msg}")
     APP_LOGS.append(f"[{timestamp}] ERROR: {msg}")
 
@@ -56,5 +77,5 @@ def log_app(msg: str):
         msg: Application message to log.
 
     """
-    timestamp = datetime.datetime.now().isoformat()
+    timestamp = _timestamp()
     APP_LOGS.append(f"[{timestamp}] {msg}")
@@ -4,12 +4,21 @@ Handles downloading pages from the Reticulum network using
 the nomadnetwork protocol.
 """
 
+import functools
 import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import Future
 from dataclasses import dataclass
 
 import RNS
 
+PATH_TIMEOUT = 30
+PATH_POLL_MIN = 0.005
+PATH_POLL_MAX = 0.2
+LINK_POOL_SIZE = 16
+LINK_IDLE_TIMEOUT = 60
+
 
 @dataclass
 class PageRequest:
@@ -23,6 +32,174 @@ class PageRequest:
     field_data: dict | None = None
 
 
+_inflight: dict[tuple[str, str], Future] = {}
+_inflight_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=64)
+def _get_destination(destination_hash: str) -> RNS.Destination:
+    """Return the nomadnetwork.node destination for a hash, building it once.
+
+    A destination hash is derived from its identity's public key, so a
+    cached entry can never go stale. A failed recall raises instead of
+    returning, which keeps misses out of the cache.
+
+    Raises:
+        Exception: If the identity for the destination is not known yet.
+
+    """
+    identity = RNS.Identity.recall(bytes.fromhex(destination_hash))
+    if not identity:
+        raise Exception("Identity not found")
+    return RNS.Destination(
+        identity,
+        RNS.Destination.OUT,
+        RNS.Destination.SINGLE,
+        "nomadnetwork",
+        "node",
+    )
+
+
+# Established links by destination hash, least recently used first, with the
+# time each was last handed out.
+_links: OrderedDict[str, tuple[RNS.Link, float]] = OrderedDict()
+# Events of the fetches currently waiting on each link, woken if it closes.
+_link_waiters: dict[RNS.Link, set[threading.Event]] = {}
+_links_lock = threading.Lock()
+
+
+def _teardown_links(links) -> None:
+    """Tear down links that are no longer pooled, skipping closed ones."""
+    for link in links:
+        if link.status != RNS.Link.CLOSED:
+            link.teardown()
+
+
+def _is_pooled(link: RNS.Link) -> bool:
+    """Return whether ``link`` is in the pool; the caller holds _links_lock."""
+    return any(entry[0] is link for entry in _links.values())
+
+
+def _unused(links: list[RNS.Link]) -> list[RNS.Link]:
+    """Filter out links a fetch is still waiting on; caller holds _links_lock.
+
+    Links left out here are torn down by _unwatch_link once their last
+    waiter is done with them.
+    """
+    return [link for link in links if link not in _link_waiters]
+
+
+def _pop_idle_links(now: float) -> list[RNS.Link]:
+    """Remove links idle past LINK_IDLE_TIMEOUT; the caller holds _links_lock.
+
+    The pool is ordered by last use, so idle links are always at the front.
+    """
+    idle = []
+    while _links:
+        _, last_used = next(iter(_links.values()))
+        if now - last_used < LINK_IDLE_TIMEOUT:
+            break
+        idle.append(_links.popitem(last=False)[1][0])
+    return idle
+
+
+def _pooled_link(destination_hash: str) -> RNS.Link | None:
+    """Return a live pooled link to a destination, or None if there is none.
+
+    Links that have closed or sat idle for longer than LINK_IDLE_TIMEOUT are
+    removed from the pool, and torn down once no fetch is using them.
+    """
+    now = time.monotonic()
+    with _links_lock:
+        stale = _pop_idle_links(now)
+        entry = _links.pop(destination_hash, None)
+        link = None
+        if entry is not None:
+            if entry[0].status == RNS.Link.ACTIVE:
+                link = entry[0]
+                _links[destination_hash] = (link, now)
+            else:
+                stale.append(entry[0])
+        stale = _unused(stale)
+    _teardown_links(stale)
+    return link
+
+
+def _pool_link(destination_hash: str, link: RNS.Link) -> None:
+    """Keep an established link for reuse, evicting the least recently used.
+
+    A live link already pooled for the destination is kept; the new link
+    then serves only its own request and is torn down once that finishes.
+    """
+    now = time.monotonic()
+    with _links_lock:
+        evicted = _pop_idle_links(now)
+        current = _links.get(destination_hash)
+        if current is None or current[0].status != RNS.Link.ACTIVE:
+            if current is not None:
+                evicted.append(current[0])
+            _links[destination_hash] = (link, now)
+            _links.move_to_end(destination_hash)
+        while len(_links) > LINK_POOL_SIZE:
+            evicted.append(_links.popitem(last=False)[1][0])
+        evicted = _unused(evicted)
+    _teardown_links(evicted)
+
+
+def _drop_link(destination_hash: str, link: RNS.Link) -> None:
+    """Stop handing out a link after one of its requests failed.
+
+    Other requests may still be in flight on it, so a link that is still
+    ACTIVE is left open; it is torn down once its last waiter is done.
+    """
+    with _links_lock:
+        entry = _links.get(destination_hash)
+        if entry is not None and entry[0] is link:
+            del _links[destination_hash]
+    if link.status != RNS.Link.ACTIVE:
+        _teardown_links([link])
+
+
+def _watch_link(link: RNS.Link, ev: threading.Event) -> None:
+    """Wake ``ev`` if ``link`` closes while a fetch is waiting on it."""
+    with _links_lock:
+        _link_waiters.setdefault(link, set()).add(ev)
+    if link.status == RNS.Link.CLOSED:
+        ev.set()
+
+
+def _unwatch_link(link: RNS.Link, ev: threading.Event) -> None:
+    """Stop waking ``ev`` for ``link`` once its fetch has finished.
+
+    A link that is out of the pool is torn down when its last waiter leaves.
+    """
+    with _links_lock:
+        waiters = _link_waiters.get(link)
+        if waiters is not None:
+            waiters.discard(ev)
+            if not waiters:
+                del _link_waiters[link]
+        orphaned = link not in _link_waiters and not _is_pooled(link)
+    if orphaned:
+        _teardown_links([link])
+
+
+def _on_link_closed(link: RNS.Link) -> None:
+    """Drop a closed link from the pool and wake every fetch waiting on it.
+
+    Every link is built with this as its closed callback, so a pooled link
+    that closes under a later request still wakes that request.
+    """
+    with _links_lock:
+        for destination_hash, entry in _links.items():
+            if entry[0] is link:
+                del _links[destination_hash]
+                break
+        waiters = _link_waiters.pop(link, ())
+    for ev in waiters:
+        ev.set()
+
+
 class PageFetcher:
     """Fetcher to download pages from the Reticulum network."""
 
@@ -44,29 +221,77 @@ class PageFetcher:
             Exception: If no path to destination or identity not found.
 
         """
+        # Form submissions are never shared; plain page loads are idempotent,
+        # so concurrent requests for the same page wait on a single download.
+        if req.field_data is not None:
+            return PageFetcher._download(req)
+
+        key = (req.destination_hash, req.page_path)
+        with _inflight_lock:
+            future = _inflight.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                _inflight[key] = future
+        if not owner:
+            return future.result()
+
+        try:
+            data_str = PageFetcher._download(req)
+        except Exception as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(data_str)
+            return data_str
+        finally:
+            with _inflight_lock:
+                _inflight.pop(key, None)
+            # Never leave waiters blocked, even if the download was aborted
+            # by something other than an Exception.
+            if not future.done():
+                future.set_exception(Exception("Page download was interrupted"))
+
+    @staticmethod
+    def _download(req: PageRequest) -> str:
+        """Perform the network fetch for a single PageRequest."""
         RNS.log(
             f"PageFetcher: starting fetch of {req.page_path} from {req.destination_hash}",
         )
-        dest_bytes = bytes.fromhex(req.destination_hash)
-        if not RNS.Transport.has_path(dest_bytes):
-            RNS.Transport.request_path(dest_bytes)
-            start = time.time()
-            while not RNS.Transport.has_path(dest_bytes):
-                if time.time() - start > 30:
-                    raise Exception(f"No path to destination {req.destination_hash}")
-                time.sleep(0.1)
-        identity = RNS.Identity.recall(dest_bytes)
-        if not identity:
-            raise Exception("Identity not found")
-        destination = RNS.Destination(
-            identity,
-            RNS.Destination.OUT,
-            RNS.Destination.SINGLE,
-            "nomadnetwork",
-            "node",
+        data = None
+        link = _pooled_link(req.destination_hash)
+        if link is not None:
+            data, timed_out = PageFetcher._exchange(req, link)
+            # A pooled link may have gone away under us; page loads are safe
+            # to repeat, so retry once on a fresh link. Form submissions are
+            # not, as the node may already have acted on them.
+            if data is None and not timed_out and req.field_data is None:
+                RNS.log(
+                    f"PageFetcher: pooled link to {req.destination_hash} failed, "
+                    "retrying on a new link",
+                )
+                link = None
+        if link is None:
+            PageFetcher._await_path(req.destination_hash)
+            data, _ = PageFetcher._exchange(req)
+        data_str = data or "No content received"
+        RNS.log(
+            f"PageFetcher: received data for {req.destination_hash}:{req.page_path}",
         )
-        link = RNS.Link(destination)
+        return data_str
+
+    @staticmethod
+    def _exchange(
+        req: PageRequest,
+        link: RNS.Link | None = None,
+    ) -> tuple[str | None, bool]:
+        """Send one request over ``link``, or over a new link if None.
 
+        Returns:
+            tuple: The response text, or None if there was none, and whether
+            the wait timed out rather than ending in a failure or close.
+
+        """
         result = {"data": None}
         ev = threading.Event()
 
@@ -78,20 +303,61 @@ class PageFetcher:
                 result["data"] = str(data)
             ev.set()
 
-        def on_failed(_):
-            ev.set()
+        def send_request(link):
+            def on_failed(_):
+                _drop_link(req.destination_hash, link)
+                ev.set()
 
-        link.set_link_established_callback(
-            lambda link: link.request(
+            link.request(
                 req.page_path,
                 req.field_data,
                 response_callback=on_response,
                 failed_callback=on_failed,
-            ),
-        )
-        ev.wait(timeout=15)
-        data_str = result["data"] or "No content received"
-        RNS.log(
-            f"PageFetcher: received data for {req.destination_hash}:{req.page_path}",
-        )
-        return data_str
+            )
+
+        def on_established(link):
+            _pool_link(req.destination_hash, link)
+            send_request(link)
+
+        if link is not None:
+            _watch_link(link, ev)
+            send_request(link)
+        else:
+            destination = _get_destination(req.destination_hash)
+            # Register callbacks at construction so a fast establishment cannot
+            # be missed, and wake immediately if the link closes instead of
+            # sitting out the full timeout.
+            link = RNS.Link(
+                destination,
+                established_callback=on_established,
+                closed_callback=_on_link_closed,
+            )
+            _watch_link(link, ev)
+        try:
+            woken = ev.wait(timeout=15)
+        finally:
+            _unwatch_link(link, ev)
+        return result["data"], not woken
+
+    @staticmethod
+    def _await_path(destination_hash: str) -> None:
+        """Block until Reticulum knows a path to the destination.
+
+        Raises:
+            Exception: If no path is found within PATH_TIMEOUT seconds.
+
+        """
+        dest_bytes = bytes.fromhex(destination_hash)
+        has_path = RNS.Transport.has_path(dest_bytes)
+        if not has_path:
+            RNS.Transport.request_path(dest_bytes)
+            # Reticulum has no per-destination path callback, so poll; start
+            # fast for nearby nodes and back off for slow multi-hop discovery.
+            deadline = time.monotonic() + PATH_TIMEOUT
+            delay = PATH_POLL_MIN
+            while not has_path:
+                if time.monotonic() > deadline:
+                    raise Exception(f"No path to destination {destination_hash}")
+                time.sleep(delay)
+                delay = min(delay * 2, PATH_POLL_MAX)
+                has_path = RNS.Transport.has_path(dest_bytes)
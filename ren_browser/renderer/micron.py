@@ -3,15 +3,21 @@
 Provides rendering capabilities for micron markup content.
 """
 
+import functools
 import re
+from dataclasses import dataclass
 
 import flet as ft
 
 from ren_browser.renderer.plaintext import render_plaintext
 
 
+@functools.lru_cache(maxsize=4096)
 def hex_to_rgb(hex_color: str) -> str:
-    """Convert 3-char hex color to RGB string."""
+    """Convert 3-char hex color to RGB string.
+
+    Results are cached, since pages reuse a handful of colors heavily.
+    """
     if len(hex_color) != 3:
         return "255,255,255"
     r = int(hex_color[0], 16) * 17
@@ -20,11 +26,32 @@ def hex_to_rgb(hex_color: str) -> str:
     return f"{r},{g},{b}"
 
 
-def parse_micron_line(line: str) -> list:
-    """Parse a single line of micron markup into styled text spans.
+@dataclass(slots=True, frozen=True)
+class MicronSpan:
+    """A run of micron text sharing one style.
 
-    Returns list of dicts with 'text', 'bold', 'italic', 'underline', 'color', 'bgcolor'.
+    Colors are "r,g,b" strings, or None for the default.
     """
+
+    text: str
+    bold: bool
+    italic: bool
+    underline: bool
+    color: str | None
+    bgcolor: str | None
+
+
+# One token per formatting tag, color tag, or run of text. An unknown tag is
+# kept as literal text starting with its backtick; a trailing lone backtick
+# matches the final alternative.
+_INLINE_TOKEN_RE = re.compile(
+    r"`(?P<tag>[!*_fb`])|`(?P<color>[FB])(?P<hex>.{3})|(?P<text>`?[^`]+)|`",
+    re.DOTALL,
+)
+
+
+def parse_micron_line(line: str) -> list[MicronSpan]:
+    """Parse a single line of micron markup into styled text spans."""
     spans = []
     current_text = ""
     bold = False
@@ -33,69 +60,48 @@ def parse_micron_line(line: str) -> list:
     color = None
     bgcolor = None
 
-    i = 0
-    while i < len(line):
-        if line[i] == "`" and i + 1 < len(line):
-            if current_text:
-                spans.append(
-                    {
-                        "text": current_text,
-                        "bold": bold,
-                        "italic": italic,
-                        "underline": underline,
-                        "color": color,
-                        "bgcolor": bgcolor,
-                    },
-                )
-                current_text = ""
+    for match in _INLINE_TOKEN_RE.finditer(line):
+        kind = match.lastgroup
+        token = match.group()
+        if kind is None or (kind == "text" and token[0] != "`"):
+            current_text += token
+            continue
 
-            tag = line[i + 1]
+        if current_text:
+            spans.append(
+                MicronSpan(current_text, bold, italic, underline, color, bgcolor),
+            )
+        current_text = ""
 
+        if kind == "text":
+            current_text = token
+        elif kind == "hex":
+            if match.group("color") == "F":
+                color = hex_to_rgb(match.group("hex"))
+            else:
+                bgcolor = hex_to_rgb(match.group("hex"))
+        else:
+            tag = match.group("tag")
             if tag == "!":
                 bold = not bold
-                i += 2
             elif tag == "*":
                 italic = not italic
-                i += 2
             elif tag == "_":
                 underline = not underline
-                i += 2
-            elif tag == "F" and i + 5 <= len(line):
-                color = hex_to_rgb(line[i + 2 : i + 5])
-                i += 5
             elif tag == "f":
                 color = None
-                i += 2
-            elif tag == "B" and i + 5 <= len(line):
-                bgcolor = hex_to_rgb(line[i + 2 : i + 5])
-                i += 5
             elif tag == "b":
                 bgcolor = None
-                i += 2
-            elif tag == "`":
+            else:
                 bold = False
                 italic = False
                 underline = False
                 color = None
                 bgcolor = None
-                i += 2
-            else:
-                current_text += line[i]
-                i += 1
-        else:
-            current_text += line[i]
-            i += 1
 
     if current_text:
         spans.append(
-            {
-                "text": current_text,
-                "bold": bold,
-                "italic": italic,
-                "underline": underline,
-                "color": color,
-                "bgcolor": bgcolor,
-            },
+            MicronSpan(current_text, bold, italic, underline, color, bgcolor),
         )
 
     return spans
@@ -132,30 +138,50 @@ def _render_micron_internal(content: str, on_link_click=None) -> ft.Control:
         ft.Control: Rendered content as a Flet control.
 
     """
-    lines = content.split("\n")
-    controls = []
+    return ft.Column(
+        controls=list(_iter_line_controls(content.split("\n"), on_link_click)),
+        spacing=5,
+        scroll=ft.ScrollMode.AUTO,
+        expand=True,
+    )
+
+
+# Line-leading alignment tags; "`a" (automatic) renders as left-aligned.
+_ALIGNMENTS = {
+    "`c": ft.TextAlign.CENTER,
+    "`l": ft.TextAlign.LEFT,
+    "`r": ft.TextAlign.RIGHT,
+    "`a": ft.TextAlign.LEFT,
+}
+
+
+def _iter_line_controls(lines, on_link_click=None):
+    """Yield the controls for each line of micron markup, in order.
+
+    Alignment and section depth carry over from one line to the next.
+
+    Args:
+        lines: Iterable of markup lines without their newlines.
+        on_link_click: Optional callback function(url) called when a link is clicked.
+
+    Yields:
+        ft.Control: One control per rendered line.
+
+    """
     section_level = 0
     alignment = ft.TextAlign.LEFT
 
     for line in lines:
         if not line:
-            controls.append(ft.Container(height=10))
+            yield ft.Container(height=10)
             continue
 
         if line.startswith("#"):
             continue
 
-        if line.startswith("`c"):
-            alignment = ft.TextAlign.CENTER
-            line = line[2:]
-        elif line.startswith("`l"):
-            alignment = ft.TextAlign.LEFT
-            line = line[2:]
-        elif line.startswith("`r"):
-            alignment = ft.TextAlign.RIGHT
-            line = line[2:]
-        elif line.startswith("`a"):
-            alignment = ft.TextAlign.LEFT
+        line_alignment = _ALIGNMENTS.get(line[:2])
+        if line_alignment is not None:
+            alignment = line_alignment
             line = line[2:]
 
         if line.startswith(">"):
@@ -166,25 +192,21 @@ def _render_micron_internal(content: str, on_link_click=None) -> ft.Control:
             heading_text = line[level:].strip()
 
             if heading_text:
-                controls.append(
-                    ft.Container(
-                        content=ft.Text(
-                            heading_text,
-                            size=20 - (level * 2),
-                            weight=ft.FontWeight.BOLD,
-                            color=ft.Colors.BLUE_400,
-                        ),
-                        padding=ft.padding.only(left=level * 20, top=10, bottom=5),
+                yield ft.Container(
+                    content=ft.Text(
+                        heading_text,
+                        size=20 - (level * 2),
+                        weight=ft.FontWeight.BOLD,
+                        color=ft.Colors.BLUE_400,
                     ),
+                    padding=ft.padding.only(left=level * 20, top=10, bottom=5),
                 )
             continue
 
         if line.strip() == "-":
-            controls.append(
-                ft.Container(
-                    content=ft.Divider(color=ft.Colors.GREY_700),
-                    padding=ft.padding.only(left=section_level * 20),
-                ),
+            yield ft.Container(
+                content=ft.Divider(color=ft.Colors.GREY_700),
+                padding=ft.padding.only(left=section_level * 20),
             )
             continue
 
@@ -231,63 +253,54 @@ def _render_micron_internal(content: str, on_link_click=None) -> ft.Control:
                 )
 
             if row_controls:
-                controls.append(
-                    ft.Container(
-                        content=ft.Row(
-                            controls=row_controls,
-                            spacing=0,
-                            wrap=True,
-                        ),
-                        padding=ft.padding.only(left=section_level * 20),
+                yield ft.Container(
+                    content=ft.Row(
+                        controls=row_controls,
+                        spacing=0,
+                        wrap=True,
                     ),
+                    padding=ft.padding.only(left=section_level * 20),
                 )
                 continue
 
         spans = parse_micron_line(line)
         if spans:
-            text_controls = [create_text_span(span) for span in spans]
-
-            controls.append(
-                ft.Container(
-                    content=ft.Row(
-                        controls=text_controls,
-                        spacing=0,
-                        wrap=True,
-                        alignment=alignment,
-                    ),
-                    padding=ft.padding.only(left=section_level * 20),
+            yield ft.Container(
+                content=ft.Row(
+                    controls=[create_text_span(span) for span in spans],
+                    spacing=0,
+                    wrap=True,
+                    alignment=alignment,
                 ),
+                padding=ft.padding.only(left=section_level * 20),
             )
 
-    return ft.Column(
-        controls=controls,
-        spacing=5,
-        scroll=ft.ScrollMode.AUTO,
-        expand=True,
-    )
 
+_TEXT_STYLES: dict[tuple[bool, bool, bool], ft.TextStyle] = {}
 
-def create_text_span(span: dict) -> ft.Text:
-    """Create a Text control from a span dict."""
-    styles = []
-    if span["bold"]:
-        styles.append(ft.TextStyle(weight=ft.FontWeight.BOLD))
-    if span["italic"]:
-        styles.append(ft.TextStyle(italic=True))
 
-    text_decoration = ft.TextDecoration.UNDERLINE if span["underline"] else None
-    color = span["color"]
-    bgcolor = span["bgcolor"]
+def _text_style(bold: bool, italic: bool, underline: bool) -> ft.TextStyle:
+    """Return the shared TextStyle for a bold/italic/underline combination."""
+    key = (bold, italic, underline)
+    style = _TEXT_STYLES.get(key)
+    if style is None:
+        style = ft.TextStyle(
+            weight=ft.FontWeight.BOLD if bold else None,
+            italic=True if italic else None,
+            decoration=ft.TextDecoration.UNDERLINE if underline else None,
+        )
+        _TEXT_STYLES[key] = style
+    return style
 
-    text_style = ft.TextStyle(
-        weight=ft.FontWeight.BOLD if span["bold"] else None,
-        italic=span["italic"] if span["italic"] else None,
-        decoration=text_decoration,
-    )
+
+def create_text_span(span: MicronSpan) -> ft.Text:
+    """Create a Text control from a parsed span."""
+    color = span.color
+    bgcolor = span.bgcolor
 
     return ft.Text(
-        span["text"],
-        style=text_style,
+        span.text,
+        style=_text_style(span.bold, span.italic, span.underline),
         color=f"rgb({color})" if color else None,
         bgcolor=f"rgb({bgcolor})" if bgcolor else None,
         selectable=True,
@@ -192,13 +192,26 @@ class RNSManager:
             return False
 
     def shutdown(self) -> bool:
-        """Shut down the active Reticulum instance."""
+        """Shut down the active Reticulum instance.
+
+        Clears the Reticulum singleton and the Transport destination tables so
+        a later ``initialize`` can build a fresh instance: ``Transport.start``
+        registers its own IN control destinations again, and registering a
+        hash that is still present fails. Announce handlers are kept and carry
+        over to the new instance.
+        """
         try:
             if self.reticulum and hasattr(self.reticulum, "exit_handler"):
                 self.reticulum.exit_handler()
-        except Exception:
+        except Exception as exc:
+            self.last_error = str(exc)
             return False
         finally:
+            if self.reticulum is not None:
+                RNS.Reticulum._Reticulum__instance = None
+                RNS.Transport.destinations = []
+                RNS.Transport.control_destinations = []
+                RNS.Transport.control_hashes = []
             self.reticulum = None
         return True
 
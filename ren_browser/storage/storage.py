@@ -7,10 +7,17 @@ and other application data across different platforms.
 import json
 import os
 import pathlib
+import stat
+import tempfile
 from typing import Any
 
 import flet as ft
 
+# os.umask can only be read by setting it, so read it once at import time,
+# before any save can run on another thread.
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
 
 class StorageManager:
     """Cross-platform storage manager for Ren Browser.
@@ -160,13 +167,13 @@ class StorageManager:
                     return stored_config
 
         try:
-            reticulum_config_path = self.get_reticulum_config_path() / "config"
-            if reticulum_config_path.exists():
-                return reticulum_config_path.read_text(encoding="utf-8")
-
-            config_path = self.get_config_path()
-            if config_path.exists():
-                return config_path.read_text(encoding="utf-8")
+            content = self._read_text_if_exists(
+                self.get_reticulum_config_path() / "config",
+            )
+            if content is None:
+                content = self._read_text_if_exists(self.get_config_path())
+            if content is not None:
+                return content
 
             # Fallback to client storage for non-Android or if files don't exist
             if self.page and hasattr(self.page, "client_storage"):
@@ -186,15 +193,13 @@ class StorageManager:
     def save_bookmarks(self, bookmarks: list) -> bool:
         """Save bookmarks to storage."""
         try:
-            bookmarks_path = self._storage_dir / "bookmarks.json"
-            with open(bookmarks_path, "w", encoding="utf-8") as f:
-                json.dump(bookmarks, f, indent=2)
+            self._write_text_atomic(
+                self._storage_dir / "bookmarks.json",
+                json.dumps(bookmarks, indent=2),
+            )
 
             if self.page and hasattr(self.page, "client_storage"):
-                self.page.client_storage.set(
-                    "ren_browser_bookmarks",
-                    json.dumps(bookmarks),
-                )
+                self.page.client_storage.set("ren_browser_bookmarks", json.dumps(bookmarks))
 
             return True
         except Exception:
@@ -203,10 +208,9 @@ class StorageManager:
     def load_bookmarks(self) -> list:
         """Load bookmarks from storage."""
         try:
-            bookmarks_path = self._storage_dir / "bookmarks.json"
-            if bookmarks_path.exists():
-                with open(bookmarks_path, encoding="utf-8") as f:
-                    return json.load(f)
+            content = self._read_text_if_exists(self._storage_dir / "bookmarks.json")
+            if content is not None:
+                return json.loads(content)
 
             if self.page and hasattr(self.page, "client_storage"):
                 stored_bookmarks = self.page.client_storage.get("ren_browser_bookmarks")
@@ -221,9 +225,10 @@ class StorageManager:
     def save_history(self, history: list) -> bool:
         """Save browsing history to storage."""
         try:
-            history_path = self._storage_dir / "history.json"
-            with open(history_path, "w", encoding="utf-8") as f:
-                json.dump(history, f, indent=2)
+            self._write_text_atomic(
+                self._storage_dir / "history.json",
+                json.dumps(history, indent=2),
+            )
 
             if self.page and hasattr(self.page, "client_storage"):
                 self.page.client_storage.set("ren_browser_history", json.dumps(history))
@@ -235,10 +240,9 @@ class StorageManager:
     def load_history(self) -> list:
         """Load browsing history from storage."""
         try:
-            history_path = self._storage_dir / "history.json"
-            if history_path.exists():
-                with open(history_path, encoding="utf-8") as f:
-                    return json.load(f)
+            content = self._read_text_if_exists(self._storage_dir / "history.json")
+            if content is not None:
+                return json.loads(content)
 
             if self.page and hasattr(self.page, "client_storage"):
                 stored_history = self.page.client_storage.get("ren_browser_history")
@@ -253,15 +257,13 @@ class StorageManager:
     def save_app_settings(self, settings: dict) -> bool:
         """Save application settings to storage."""
         try:
-            settings_path = self._storage_dir / "settings.json"
-            with open(settings_path, "w", encoding="utf-8") as f:
-                json.dump(settings, f, indent=2)
+            self._write_text_atomic(
+                self._storage_dir / "settings.json",
+                json.dumps(settings, indent=2),
+            )
 
             if self.page and hasattr(self.page, "client_storage"):
-                self.page.client_storage.set(
-                    "ren_browser_settings",
-                    json.dumps(settings),
-                )
+                self.page.client_storage.set("ren_browser_settings", json.dumps(settings))
 
             return True
         except Exception:
@@ -275,11 +277,10 @@ class StorageManager:
         }
 
         try:
-            settings_path = self._storage_dir / "settings.json"
-            if settings_path.exists():
-                with open(settings_path, encoding="utf-8") as f:
-                    loaded = json.load(f)
-                    return {**default_settings, **loaded}
+            content = self._read_text_if_exists(self._storage_dir / "settings.json")
+            if content is not None:
+                loaded = json.loads(content)
+                return {**default_settings, **loaded}
 
             if self.page and hasattr(self.page, "client_storage"):
                 stored_settings = self.page.client_storage.get("ren_browser_settings")
@@ -303,6 +304,48 @@ class StorageManager:
             "has_client_storage": self.page and hasattr(self.page, "client_storage"),
         }
 
+    @staticmethod
+    def _read_text_if_exists(path: pathlib.Path) -> str | None:
+        """Read a text file in one open call, returning None if it is missing."""
+        try:
+            return path.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return None
+
+    @staticmethod
+    def _write_text_atomic(path: pathlib.Path, content: str) -> None:
+        """Write text via a synced temporary file so a crash never leaves a torn file.
+
+        Each write uses its own temporary file, so concurrent saves of the same
+        file cannot clobber each other's staging copy. The temporary file is
+        created private, so it takes the target's permissions (or the umask
+        default for a new file) before replacing it.
+        """
+        try:
+            mode = stat.S_IMODE(path.stat().st_mode)
+        except FileNotFoundError:
+            mode = 0o666 & ~_UMASK
+        tmp_path = None
+        try:
+            with tempfile.NamedTemporaryFile(
+                "w",
+                encoding="utf-8",
+                dir=path.parent,
+                prefix=path.name + ".",
+                suffix=".tmp",
+                delete=False,
+            ) as tmp_file:
+                tmp_path = tmp_file.name
+                tmp_file.write(content)
+                tmp_file.flush()
+                os.fsync(tmp_file.fileno())
+            os.chmod(tmp_path, mode)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
     @staticmethod
     def _is_writable(path: pathlib.Path) -> bool:
         """Check if a directory is writable."""
@@ -44,6 +44,12 @@ def _read_config_text(config_path: Path) -> str:
 
 
 def _write_config_text(config_path: Path, content: str) -> None:
+    """Write the config text unless the file already holds exactly that text."""
+    try:
+        if config_path.read_text(encoding="utf-8") == content:
+            return
+    except FileNotFoundError:
+        pass
     config_path.parent.mkdir(parents=True, exist_ok=True)
     config_path.write_text(content, encoding="utf-8")
 
@@ -1,3 +1,4 @@
+from collections import deque
 from unittest.mock import Mock
 
 import flet as ft
@@ -104,7 +105,7 @@ class TestModuleIntegration:
         assert hasattr(logs, "ERROR_LOGS")
         assert hasattr(logs, "RET_LOGS")
 
-        # Test that they are lists
-        assert isinstance(logs.APP_LOGS, list)
-        assert isinstance(logs.ERROR_LOGS, list)
-        assert isinstance(logs.RET_LOGS, list)
+        # Test that they are bounded buffers
+        assert isinstance(logs.APP_LOGS, deque)
+        assert isinstance(logs.ERROR_LOGS, deque)
+        assert isinstance(logs.RET_LOGS, deque)
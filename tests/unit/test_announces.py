@@ -1,4 +1,8 @@
-from ren_browser.announces.announces import Announce
+from unittest.mock import Mock, patch
+
+import pytest
+
+from ren_browser.announces.announces import Announce, AnnounceService
 
 
 class TestAnnounce:
@@ -28,6 +32,13 @@ class TestAnnounce:
         assert announce.display_name is None
         assert announce.timestamp == 1234567890
 
+    def test_announce_is_immutable(self):
+        """Test that Announce instances cannot be modified."""
+        announce = Announce("hash1", "Node1", 1000)
+
+        with pytest.raises(AttributeError):
+            announce.display_name = "Other"
+
 
 class TestAnnounceService:
     """Test cases for the AnnounceService class.
@@ -52,3 +63,47 @@ class TestAnnounceService:
         filtered = [ann for ann in announces if ann.destination_hash == "hash1"]
         assert len(filtered) == 1
         assert filtered[0].display_name == "Node1"
+
+    @pytest.fixture
+    def service(self):
+        """Create an AnnounceService with RNS patched out."""
+        with patch("ren_browser.announces.announces.RNS") as mock_rns:
+            mock_rns.loglevel = 4
+            mock_rns.LOG_DEBUG = 7
+            yield AnnounceService(update_callback=Mock())
+
+    def test_repeated_announce_moves_to_front(self, service):
+        """Test that a re-announcing node is deduplicated and listed first."""
+        service.received_announce(bytes.fromhex("aa"), None, b"Node A")
+        service.received_announce(bytes.fromhex("bb"), None, b"Node B")
+        service.received_announce(bytes.fromhex("aa"), None, b"Node A2")
+        service._queue.join()
+
+        announces = service.get_announces()
+        assert isinstance(announces, tuple)
+        assert [ann.destination_hash for ann in announces] == ["aa", "bb"]
+        assert announces[0].display_name == "Node A2"
+
+    def test_announce_burst_coalesces_updates(self, service):
+        """Test that a burst of announces notifies the UI once."""
+        for hex_hash in ("aa", "bb", "cc"):
+            service.received_announce(bytes.fromhex(hex_hash), None, None)
+        service._queue.join()
+        timer = service._update_timer
+
+        service.update_callback.assert_not_called()
+        timer.join(timeout=1)
+
+        service.update_callback.assert_called_once_with(service.get_announces())
+
+    def test_oldest_announces_evicted_past_limit(self, service):
+        """Test that retention is capped at max_announces."""
+        service.max_announces = 2
+        for hex_hash in ("aa", "bb", "cc"):
+            service.received_announce(bytes.fromhex(hex_hash), None, None)
+        service._queue.join()
+
+        assert [ann.destination_hash for ann in service.get_announces()] == [
+            "cc",
+            "bb",
+        ]
@@ -3,6 +3,8 @@ from unittest.mock import Mock, patch
 
 from ren_browser import logs
 
+NOON_NS = int(datetime.datetime(2023, 1, 1, 12, 0, 0).timestamp()) * 1_000_000_000
+
 
 class TestLogsModule:
     """Test cases for the logs module."""
@@ -15,17 +17,13 @@ class TestLogsModule:
 
     def test_initial_state(self):
         """Test that logs start empty."""
-        assert logs.APP_LOGS == []
-        assert logs.ERROR_LOGS == []
-        assert logs.RET_LOGS == []
+        assert len(logs.APP_LOGS) == 0
+        assert len(logs.ERROR_LOGS) == 0
+        assert len(logs.RET_LOGS) == 0
 
     def test_log_error(self):
         """Test log_error function."""
-        with patch("datetime.datetime") as mock_datetime:
-            mock_now = Mock()
-            mock_now.isoformat.return_value = "2023-01-01T12:00:00"
-            mock_datetime.now.return_value = mock_now
-
+        with patch("time.time_ns", return_value=NOON_NS):
             logs.log_error("Test error message")
 
             assert len(logs.ERROR_LOGS) == 1
@@ -35,11 +33,7 @@ class TestLogsModule:
 
     def test_log_app(self):
         """Test log_app function."""
-        with patch("datetime.datetime") as mock_datetime:
-            mock_now = Mock()
-            mock_now.isoformat.return_value = "2023-01-01T12:00:00"
-            mock_datetime.now.return_value = mock_now
-
+        with patch("time.time_ns", return_value=NOON_NS):
             logs.log_app("Test app message")
 
             assert len(logs.APP_LOGS) == 1
@@ -47,11 +41,7 @@ class TestLogsModule:
 
     def test_log_ret_with_original_function(self, mock_rns):
         """Test log_ret function calls original RNS.log."""
-        with patch("datetime.datetime") as mock_datetime:
-            mock_now = Mock()
-            mock_now.isoformat.return_value = "2023-01-01T12:00:00"
-            mock_datetime.now.return_value = mock_now
-
+        with patch("time.time_ns", return_value=NOON_NS):
             logs._original_rns_log = Mock(return_value="original_result")
 
             result = logs.log_ret("Test RNS message", "arg1", kwarg1="value1")
@@ -67,11 +57,7 @@ class TestLogsModule:
 
     def test_multiple_log_calls(self):
         """Test multiple log calls accumulate correctly."""
-        with patch("datetime.datetime") as mock_datetime:
-            mock_now = Mock()
-            mock_now.isoformat.return_value = "2023-01-01T12:00:00"
-            mock_datetime.now.return_value = mock_now
-
+        with patch("time.time_ns", return_value=NOON_NS):
             logs.log_error("Error 1")
             logs.log_error("Error 2")
             logs.log_app("App message")
@@ -85,10 +71,9 @@ class TestLogsModule:
     def test_timestamp_format(self):
         """Test that timestamps are properly formatted."""
         real_datetime = datetime.datetime(2023, 1, 1, 12, 30, 45, 123456)
+        now_ns = int(real_datetime.timestamp()) * 1_000_000_000 + 123_456_000
 
-        with patch("datetime.datetime") as mock_datetime:
-            mock_datetime.now.return_value = real_datetime
-
+        with patch("time.time_ns", return_value=now_ns):
             logs.log_app("Test message")
 
             expected_timestamp = real_datetime.isoformat()
@@ -118,11 +103,7 @@ class TestLogsModule:
 
     def test_empty_message_handling(self):
         """Test handling of empty messages."""
-        with patch("datetime.datetime") as mock_datetime:
-            mock_now = Mock()
-            mock_now.isoformat.return_value = "2023-01-01T12:00:00"
-            mock_datetime.now.return_value = mock_now
-
+        with patch("time.time_ns", return_value=NOON_NS):
             logs.log_error("")
             logs.log_app("")
 
@@ -132,12 +113,17 @@ class TestLogsModule:
 
     def test_special_characters_in_messages(self):
         """Test handling of special characters in log messages."""
-        with patch("datetime.datetime") as mock_datetime:
-            mock_now = Mock()
-            mock_now.isoformat.return_value = "2023-01-01T12:00:00"
-            mock_datetime.now.return_value = mock_now
-
+        with patch("time.time_ns", return_value=NOON_NS):
             special_msg = "Message with\nnewlines\tand\ttabs and unicode: 🚀"
             logs.log_app(special_msg)
 
             assert logs.APP_LOGS[0] == f"[2023-01-01T12:00:00] {special_msg}"
+
+    def test_logs_keep_only_recent_entries(self):
+        """Test that each stream drops its oldest entries past the limit."""
+        for i in range(logs.MAX_LOG_ENTRIES + 5):
+            logs.log_app(f"message {i}")
+
+        assert len(logs.APP_LOGS) == logs.MAX_LOG_ENTRIES
+        assert logs.APP_LOGS[0].endswith("message 5")
+        assert logs.APP_LOGS[-1].endswith(f"message {logs.MAX_LOG_ENTRIES + 4}")
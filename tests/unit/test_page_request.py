@@ -1,4 +1,10 @@
-from ren_browser.pages.page_request import PageRequest
+import threading
+from unittest.mock import Mock, patch
+
+import pytest
+
+from ren_browser.pages import page_request
+from ren_browser.pages.page_request import PageFetcher, PageRequest
 
 
 class TestPageRequest:
@@ -74,3 +80,297 @@ class TestPageFetcher:
         # Test requests without form data
         simple_requests = [req for req in requests if req.field_data is None]
         assert len(simple_requests) == 2
+
+    def test_concurrent_fetches_share_one_download(self):
+        """Test that identical concurrent page loads trigger one download."""
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def fake_download(req):
+            calls.append(req)
+            started.set()
+            release.wait(timeout=5)
+            return "page content"
+
+        req = PageRequest("hash1", "/index.mu")
+        results = []
+
+        def fetch():
+            results.append(PageFetcher.fetch_page(req))
+
+        with patch.object(PageFetcher, "_download", side_effect=fake_download):
+            first = threading.Thread(target=fetch)
+            first.start()
+            assert started.wait(timeout=5)
+
+            # Release the download only once the second caller is waiting on
+            # the shared future, so it cannot become an owner itself.
+            future = page_request._inflight[("hash1", "/index.mu")]
+            waiting = threading.Event()
+            original_result = future.result
+
+            def result(*args, **kwargs):
+                waiting.set()
+                return original_result(*args, **kwargs)
+
+            future.result = result
+            second = threading.Thread(target=fetch)
+            second.start()
+            assert waiting.wait(timeout=5)
+            release.set()
+            first.join(timeout=5)
+            second.join(timeout=5)
+
+        assert len(calls) == 1
+        assert results == ["page content", "page content"]
+
+    def test_interrupted_download_releases_waiters(self):
+        """Test that waiters are not left blocked by a non-Exception abort."""
+        req = PageRequest("hash1", "/index.mu")
+        future_holder = []
+
+        def fake_download(req):
+            future_holder.append(page_request._inflight[("hash1", "/index.mu")])
+            raise KeyboardInterrupt
+
+        with (
+            patch.object(PageFetcher, "_download", side_effect=fake_download),
+            pytest.raises(KeyboardInterrupt),
+        ):
+            PageFetcher.fetch_page(req)
+
+        with pytest.raises(Exception, match="interrupted"):
+            future_holder[0].result(timeout=1)
+
+    def test_form_submissions_are_not_shared(self):
+        """Test that requests carrying field data always download."""
+        req = PageRequest("hash1", "/form.mu", {"field": "value"})
+
+        with patch.object(
+            PageFetcher,
+            "_download",
+            return_value="ok",
+        ) as mock_download:
+            PageFetcher.fetch_page(req)
+            PageFetcher.fetch_page(req)
+
+        assert mock_download.call_count == 2
+
+    def test_link_pool_reuses_and_evicts_links(self):
+        """Test that live links are reused and the oldest is torn down."""
+        mock_rns = Mock()
+        mock_rns.Link.ACTIVE = "active"
+        mock_rns.Link.CLOSED = "closed"
+        links = [Mock(status="active") for _ in range(page_request.LINK_POOL_SIZE + 1)]
+
+        with (
+            patch.object(page_request, "RNS", mock_rns),
+            patch.dict(page_request._links, clear=True),
+        ):
+            for i, link in enumerate(links):
+                page_request._pool_link(f"hash{i}", link)
+
+            links[0].teardown.assert_called_once()
+            assert page_request._pooled_link("hash0") is None
+            assert page_request._pooled_link("hash1") is links[1]
+
+            links[1].status = "closed"
+            assert page_request._pooled_link("hash1") is None
+            links[1].teardown.assert_not_called()
+
+    def test_link_pool_sweeps_idle_links(self):
+        """Test that links idle past the timeout are torn down on next use."""
+        mock_rns = Mock()
+        mock_rns.Link.ACTIVE = "active"
+        mock_rns.Link.CLOSED = "closed"
+        idle_link = Mock(status="active")
+        fresh_link = Mock(status="active")
+
+        with (
+            patch.object(page_request, "RNS", mock_rns),
+            patch.dict(page_request._links, clear=True),
+            patch("time.monotonic", return_value=1000.0),
+        ):
+            page_request._pool_link("idle", idle_link)
+            with patch(
+                "time.monotonic",
+                return_value=1000.0 + page_request.LINK_IDLE_TIMEOUT,
+            ):
+                page_request._pool_link("fresh", fresh_link)
+
+            idle_link.teardown.assert_called_once()
+            assert list(page_request._links) == ["fresh"]
+
+    def test_closed_link_wakes_every_waiting_fetch(self):
+        """Test that a pooled link closing wakes all fetches using it."""
+        mock_rns = Mock()
+        mock_rns.Link.ACTIVE = "active"
+        mock_rns.Link.CLOSED = "closed"
+        link = Mock(status="active")
+        first, second = threading.Event(), threading.Event()
+
+        with (
+            patch.object(page_request, "RNS", mock_rns),
+            patch.dict(page_request._links, clear=True),
+            patch.dict(page_request._link_waiters, clear=True),
+        ):
+            page_request._pool_link("hash1", link)
+            page_request._watch_link(link, first)
+            page_request._watch_link(link, second)
+
+            link.status = "closed"
+            page_request._on_link_closed(link)
+
+            assert first.is_set()
+            assert second.is_set()
+            assert "hash1" not in page_request._links
+            assert link not in page_request._link_waiters
+
+
+class FakeLink:
+    """Stand-in for RNS.Link that establishes at once and answers on demand."""
+
+    ACTIVE = "active"
+    CLOSED = "closed"
+    created = []
+
+    def __init__(self, destination, established_callback, closed_callback):
+        self.status = self.ACTIVE
+        self.closed_callback = closed_callback
+        self.pending = {}
+        self.torn_down = False
+        FakeLink.created.append(self)
+        established_callback(self)
+
+    def request(self, path, data, response_callback, failed_callback):
+        self.pending[path] = (response_callback, failed_callback)
+        if path.startswith("/page/ok"):
+            self.respond(path)
+        elif path == "/page/missing.mu":
+            failed_callback(None)
+
+    def respond(self, path):
+        response_callback, _ = self.pending.pop(path)
+        response_callback(Mock(response=f"content of {path}".encode()))
+
+    def teardown(self):
+        self.torn_down = True
+        self.status = self.CLOSED
+        self.closed_callback(self)
+
+
+class TestPageFetcherLinks:
+    """Test cases driving PageFetcher._download over pooled links."""
+
+    @pytest.fixture(autouse=True)
+    def fake_rns(self):
+        """Patch RNS with FakeLink and an always-known path and identity."""
+        mock_rns = Mock()
+        mock_rns.Link = FakeLink
+        mock_rns.Transport.has_path.return_value = True
+        FakeLink.created = []
+        page_request._get_destination.cache_clear()
+        with (
+            patch.object(page_request, "RNS", mock_rns),
+            patch.dict(page_request._links, clear=True),
+            patch.dict(page_request._link_waiters, clear=True),
+        ):
+            yield mock_rns
+        page_request._get_destination.cache_clear()
+
+    def _start(self, path):
+        """Run a download on a thread and return its result holder."""
+        results = []
+        thread = threading.Thread(
+            target=lambda: results.append(
+                PageFetcher._download(PageRequest("abcd", path)),
+            ),
+        )
+        thread.start()
+        return thread, results
+
+    def _wait_pending(self, link, path):
+        """Wait until ``path`` has been requested on ``link``."""
+        for _ in range(500):
+            if path in link.pending:
+                return
+            threading.Event().wait(0.01)
+        raise AssertionError(f"{path} was never requested")
+
+    def test_second_request_reuses_pooled_link(self):
+        """Test that a later fetch to the same node reuses its link."""
+        first = PageFetcher._download(PageRequest("abcd", "/page/ok1.mu"))
+        second = PageFetcher._download(PageRequest("abcd", "/page/ok2.mu"))
+
+        assert first == "content of /page/ok1.mu"
+        assert second == "content of /page/ok2.mu"
+        assert len(FakeLink.created) == 1
+
+    def test_failed_request_keeps_shared_link_open(self):
+        """Test that one failed request does not kill others on the link."""
+        PageFetcher._download(PageRequest("abcd", "/page/ok.mu"))
+        shared = FakeLink.created[0]
+        thread, results = self._start("/page/big.mu")
+        self._wait_pending(shared, "/page/big.mu")
+
+        missing = PageFetcher._download(PageRequest("abcd", "/page/missing.mu"))
+        assert missing == "No content received"
+        assert not shared.torn_down
+
+        shared.respond("/page/big.mu")
+        thread.join(timeout=5)
+
+        assert results == ["content of /page/big.mu"]
+        # Out of the pool and no longer in use, so it is closed afterwards.
+        assert shared.torn_down
+
+    def test_closed_pooled_link_retries_on_new_link(self):
+        """Test that a pooled link closing mid-request falls back to a new one."""
+        PageFetcher._download(PageRequest("abcd", "/page/ok.mu"))
+        stale = FakeLink.created[0]
+        thread, results = self._start("/page/slow.mu")
+        self._wait_pending(stale, "/page/slow.mu")
+
+        stale.teardown()
+        fresh = None
+        for _ in range(500):
+            if len(FakeLink.created) == 2:
+                fresh = FakeLink.created[1]
+                break
+            threading.Event().wait(0.01)
+        assert fresh is not None
+        self._wait_pending(fresh, "/page/slow.mu")
+        fresh.respond("/page/slow.mu")
+        thread.join(timeout=5)
+
+        assert results == ["content of /page/slow.mu"]
+
+    def test_concurrent_new_links_keep_the_busy_one(self):
+        """Test that pooling a second link does not close one still in use."""
+        thread_a, results_a = self._start("/page/a.mu")
+        for _ in range(500):
+            if FakeLink.created and "/page/a.mu" in FakeLink.created[0].pending:
+                break
+            threading.Event().wait(0.01)
+        link_a = FakeLink.created[0]
+        # Force a second cold link, as if both fetches missed the pool.
+        with patch.object(page_request, "_pooled_link", return_value=None):
+            thread_b, results_b = self._start("/page/b.mu")
+            for _ in range(500):
+                if len(FakeLink.created) == 2:
+                    break
+                threading.Event().wait(0.01)
+            link_b = FakeLink.created[1]
+            self._wait_pending(link_b, "/page/b.mu")
+            link_b.respond("/page/b.mu")
+            thread_b.join(timeout=5)
+
+        assert not link_a.torn_down
+        assert link_b.torn_down
+        link_a.respond("/page/a.mu")
+        thread_a.join(timeout=5)
+
+        assert results_a == ["content of /page/a.mu"]
+        assert results_b == ["content of /page/b.mu"]
+        assert page_request._links["abcd"][0] is link_a
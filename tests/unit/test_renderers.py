@@ -1,6 +1,6 @@
 import flet as ft
 
-from ren_browser.renderer.micron import render_micron
+from ren_browser.renderer.micron import MicronSpan, parse_micron_line, render_micron
 from ren_browser.renderer.plaintext import render_plaintext
 
 
@@ -88,6 +88,33 @@ class TestMicronRenderer:
         assert len(result.controls) > 0
 
 
+class TestParseMicronLine:
+    """Test cases for inline micron formatting."""
+
+    def test_formatting_tags_split_spans(self):
+        """Test that tags close the current span and change its style."""
+        spans = parse_micron_line("plain `!bold`! `Ff00red`f")
+
+        assert [span.text for span in spans] == ["plain ", "bold", " ", "red"]
+        assert spans[1].bold is True
+        assert spans[2].bold is False
+        assert spans[3].color == "255,0,0"
+
+    def test_reset_tag_clears_all_styles(self):
+        """Test that a double backtick resets every style."""
+        spans = parse_micron_line("`!`*`_`B00fstyled``plain")
+
+        assert spans[0].bold and spans[0].italic and spans[0].underline
+        assert spans[0].bgcolor == "0,0,255"
+        assert spans[1] == MicronSpan("plain", False, False, False, None, None)
+
+    def test_unknown_and_trailing_backticks_are_literal(self):
+        """Test that unrecognised tags and a final backtick stay as text."""
+        spans = parse_micron_line("a`xb`")
+
+        assert [span.text for span in spans] == ["a", "`xb`"]
+
+
 class TestRendererComparison:
     """Test cases comparing both renderers."""
 
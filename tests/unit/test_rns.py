@@ -0,0 +1,56 @@
+from unittest.mock import Mock, patch
+
+import pytest
+
+from ren_browser.rns import RNSManager
+
+
+class TestRNSManagerShutdown:
+    """Test cases for RNSManager.shutdown."""
+
+    @pytest.fixture
+    def mock_rns(self):
+        """Patch RNS with populated singleton and Transport state."""
+        with patch("ren_browser.rns.RNS") as mock_rns:
+            mock_rns.Reticulum._Reticulum__instance = Mock()
+            mock_rns.Transport.destinations = [Mock()]
+            mock_rns.Transport.control_destinations = [Mock()]
+            mock_rns.Transport.control_hashes = [b"hash"]
+            yield mock_rns
+
+    def test_shutdown_resets_reticulum_state(self, mock_rns):
+        """Test that shutdown clears the singleton and destination tables."""
+        manager = RNSManager()
+        reticulum = Mock()
+        manager.reticulum = reticulum
+
+        assert manager.shutdown() is True
+
+        reticulum.exit_handler.assert_called_once()
+        assert manager.reticulum is None
+        assert mock_rns.Reticulum._Reticulum__instance is None
+        assert mock_rns.Transport.destinations == []
+        assert mock_rns.Transport.control_destinations == []
+        assert mock_rns.Transport.control_hashes == []
+
+    def test_shutdown_failure_records_error(self, mock_rns):
+        """Test that a failing exit handler is reported and state still reset."""
+        manager = RNSManager()
+        manager.reticulum = Mock()
+        manager.reticulum.exit_handler.side_effect = RuntimeError("busy")
+
+        assert manager.shutdown() is False
+
+        assert manager.last_error == "busy"
+        assert manager.reticulum is None
+        assert mock_rns.Reticulum._Reticulum__instance is None
+        assert mock_rns.Transport.destinations == []
+
+    def test_shutdown_without_instance_leaves_transport_alone(self, mock_rns):
+        """Test that shutting down with no instance does not touch RNS state."""
+        manager = RNSManager()
+        destinations = mock_rns.Transport.destinations
+
+        assert manager.shutdown() is True
+
+        assert mock_rns.Transport.destinations is destinations
@@ -1,4 +1,6 @@
 import json
+import os
+import stat
 import tempfile
 from pathlib import Path
 from unittest.mock import Mock, patch
@@ -329,6 +331,61 @@ class TestStorageManager:
                 loaded_history = json.load(f)
             assert loaded_history == history
 
+    def test_save_bookmarks_leaves_no_temp_file(self):
+        """Test that bookmarks are written atomically via a temporary file."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            storage = StorageManager()
+            storage._storage_dir = Path(temp_dir)
+
+            bookmarks = [{"name": "Test", "url": "test://example"}]
+            storage.save_bookmarks(bookmarks)
+            storage.save_bookmarks(bookmarks + bookmarks)
+
+            assert not list(storage._storage_dir.glob("*.tmp"))
+            assert storage.load_bookmarks() == bookmarks + bookmarks
+
+    def test_failed_atomic_write_removes_temp_file(self):
+        """Test that a failed replace keeps the old file and cleans up."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            target = Path(temp_dir) / "bookmarks.json"
+            target.write_text("old", encoding="utf-8")
+
+            with (
+                patch("os.replace", side_effect=OSError("disk full")),
+                pytest.raises(OSError),
+            ):
+                StorageManager._write_text_atomic(target, "new")
+
+            assert target.read_text(encoding="utf-8") == "old"
+            assert not list(Path(temp_dir).glob("*.tmp"))
+
+    @pytest.mark.skipif(os.name != "posix", reason="POSIX permission bits")
+    def test_atomic_write_keeps_file_permissions(self):
+        """Test that replacing a file keeps its permissions, not the temp file's."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            target = Path(temp_dir) / "settings.json"
+            target.write_text("{}", encoding="utf-8")
+            target.chmod(0o644)
+
+            StorageManager._write_text_atomic(target, '{"a": 1}')
+
+            assert stat.S_IMODE(target.stat().st_mode) == 0o644
+            assert target.read_text(encoding="utf-8") == '{"a": 1}'
+
+    @pytest.mark.skipif(os.name != "posix", reason="POSIX permission bits")
+    def test_atomic_write_new_file_follows_umask(self):
+        """Test that a new file gets the umask default rather than 0600."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            reference = Path(temp_dir) / "reference"
+            reference.write_text("", encoding="utf-8")
+            target = Path(temp_dir) / "history.json"
+
+            StorageManager._write_text_atomic(target, "[]")
+
+            assert stat.S_IMODE(target.stat().st_mode) == stat.S_IMODE(
+                reference.stat().st_mode,
+            )
+
     def test_load_history(self):
         """Test loading history."""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -252,3 +252,31 @@ class TestOpenSettingsTab:
                 if hasattr(ctrl, "text")
             ]
             assert "Status" in button_labels
+
+
+class TestWriteConfigText:
+    """Test cases for writing the Reticulum config from settings."""
+
+    def test_unchanged_config_is_not_rewritten(self, tmp_path):
+        """Saving the text that was just loaded should not touch the file."""
+        from ren_browser.ui import settings
+
+        config_path = tmp_path / "config"
+        config_path.write_text("[reticulum]\n", encoding="utf-8")
+        settings._read_config_text(config_path)
+
+        with patch("pathlib.Path.write_text") as mock_write:
+            settings._write_config_text(config_path, "[reticulum]\n")
+            mock_write.assert_not_called()
+
+            settings._write_config_text(config_path, "[reticulum]\nchanged\n")
+            mock_write.assert_called_once()
+
+    def test_missing_config_is_written(self, tmp_path):
+        """A config file that does not exist yet is always written."""
+        from ren_browser.ui import settings
+
+        config_path = tmp_path / "reticulum" / "config"
+        settings._write_config_text(config_path, "")
+
+        assert config_path.read_text(encoding="utf-8") == ""